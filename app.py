@@ -1,566 +1,852 @@
-import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-import numpy as np
-import json
-
-# ============================================================
-# 1. CONFIGURACIÓN INICIAL
-# ============================================================
-st.set_page_config(page_title="Simulador r/R - NC", layout="wide")
-
-st.title("📐 Simulador de Relación de Radios y Número de Coordinación")
-st.markdown("""
-**Teoría:** Esta app visualiza cómo la relación entre el radio del catión (r) y el anión (R) 
-determina el número de coordinación (NC) estable en un sólido iónico, asumiendo el modelo de esferas rígidas.
-""")
-
-# ============================================================
-# 2. DEFINICIÓN DE CONSTANTES Y LÍMITES
-# ============================================================
-LIMITES_NC = [0.155, 0.225, 0.414, 0.732, 1.000]
-NC_TIPICOS = [3, 4, 6, 8, 12]
-GEOMETRIAS = ["Triangular", "Tetraédrica", "Octaédrica", "Cúbica", "Cuboctaédrica (Compacta)"]
-
-# Paleta de colores Viridis
-colors = [cm.viridis(i / (len(NC_TIPICOS) - 1)) for i in range(len(NC_TIPICOS))]
-
-# ============================================================
-# 3. DEFINICIÓN DE VÉRTICES NORMALIZADOS (distancia = 1)
-# ============================================================
-VERTICES_NC3 = [
-    [1.0, 0.0, 0.0],
-    [-0.5, np.sqrt(3)/2, 0.0],
-    [-0.5, -np.sqrt(3)/2, 0.0]
-]
-
-VERTICES_NC4 = [
-    [1, 1, 1],
-    [1, -1, -1],
-    [-1, 1, -1],
-    [-1, -1, 1]
-]
-VERTICES_NC4 = [[v[0]/3**0.5, v[1]/3**0.5, v[2]/3**0.5] for v in VERTICES_NC4]
-
-VERTICES_NC6 = [
-    [1, 0, 0], [-1, 0, 0],
-    [0, 1, 0], [0, -1, 0],
-    [0, 0, 1], [0, 0, -1]
-]
-
-VERTICES_NC8 = [
-    [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
-    [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1]
-]
-VERTICES_NC8 = [[v[0]/3**0.5, v[1]/3**0.5, v[2]/3**0.5] for v in VERTICES_NC8]
-
-VERTICES_NC12 = []
-for i in range(3):
-    for s1 in [-1, 1]:
-        for s2 in [-1, 1]:
-            v = [0, 0, 0]
-            v[i] = s1
-            v[(i+1) % 3] = s2
-            VERTICES_NC12.append(v[:])
-VERTICES_NC12 = [[v[0]/2**0.5, v[1]/2**0.5, v[2]/2**0.5] for v in VERTICES_NC12]
-
-# ============================================================
-# 4. INTERFAZ DE USUARIO (Sidebar)
-# ============================================================
-with st.sidebar:
-    st.header("⚙️ Controles de los Radios Iónicos")
-    st.caption("Ajusta los valores en Ångströms (Å).")
-
-    radio_cation = st.slider(
-        "Radio del Catión (r) [Å]",
-        min_value=0.1, max_value=2.0, value=1.0, step=0.01,
-        help="Selecciona el radio del catión central."
-    )
-
-    radio_anion = st.slider(
-        "Radio del Anión (R) [Å]",
-        min_value=0.1, max_value=7.0, value=1.4, step=0.01,
-        help="Varía este control para simular aniones de diferente tamaño."
-    )
-
-    st.divider()
-    st.header("🔍 Ajustes de zoom vertical (gráfica derecha)")
-    y_max_zoom = st.slider("Límite superior del eje Y", 0.2, 2.0, 1.1, 0.05)
-    y_min_zoom = st.slider("Límite inferior del eje Y", 0.0, 0.5, 0.0, 0.05)
-    if st.button("🔄 Restablecer zoom vertical"):
-        y_max_zoom = 1.1
-        y_min_zoom = 0.0
-        st.rerun()
-
-# ============================================================
-# 5. CÁLCULO PRINCIPAL
-# ============================================================
-relacion_r_R = radio_cation / radio_anion if radio_anion > 0 else 0
-
-nc_predicho = NC_TIPICOS[-1]
-geometria_predicha = GEOMETRIAS[-1]
-
-for i, limite in enumerate(LIMITES_NC):
-    if relacion_r_R < limite:
-        nc_predicho = NC_TIPICOS[i]
-        geometria_predicha = GEOMETRIAS[i]
-        break
-
-# ============================================================
-# 6. VISUALIZACIÓN DE RESULTADOS (métricas)
-# ============================================================
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("Relación r/R", f"{relacion_r_R:.3f}")
-with col2:
-    st.metric("Número de Coordinación (NC)", nc_predicho)
-with col3:
-    st.metric("Geometría", geometria_predicha)
-
-# ============================================================
-# 7. TABLA DE LÍMITES
-# ============================================================
-st.subheader("📊 Umbrales de Estabilidad para cada NC")
-df_limites = pd.DataFrame({"NC": NC_TIPICOS, "Geometría": GEOMETRIAS, "Límite inferior r/R": LIMITES_NC})
-st.dataframe(df_limites, width="stretch", hide_index=True)
-
-st.markdown(f"**Posición actual de r/R ({relacion_r_R:.3f}) en la escala:**")
-posicion_relativa = min(relacion_r_R / 1.1, 1.0)
-st.progress(posicion_relativa)
-
-marcadores = " | ".join([f"{limite:.3f} (NC={nc})" for limite, nc in zip(LIMITES_NC, NC_TIPICOS)])
-st.caption(f"**Límites:** {marcadores}")
-
-# ============================================================
-# 8. GRÁFICOS (dos columnas)
-# ============================================================
-st.subheader("📈 Relación entre R y r/R")
-col_grafica1, col_grafica2 = st.columns(2)
-
-R_range_full = [i/100 for i in range(10, 701)]
-r_R_range_full = [radio_cation / R if R > 0 else 0 for R in R_range_full]
-
-# --- GRÁFICA 1: Vista completa ---
-with col_grafica1:
-    st.markdown("**Vista completa – modelo extendido**")
-    fig1, ax1 = plt.subplots(figsize=(8, 5))
-    ax1.plot(R_range_full, r_R_range_full, 'b-', linewidth=2.5, label='r/R')
-    ax1.axhline(y=relacion_r_R, color='r', linestyle='--', alpha=0.7, linewidth=1.5,
-                label=f'Valor actual ({relacion_r_R:.2f})')
-    ax1.axvline(x=radio_anion, color='g', linestyle='--', alpha=0.7, linewidth=1.5,
-                label=f'R actual ({radio_anion:.2f} Å)')
-
-    for i, nc in enumerate(NC_TIPICOS):
-        y_min = 0 if i == 0 else LIMITES_NC[i-1]
-        y_max = LIMITES_NC[i]
-        ax1.axhspan(y_min, y_max, alpha=0.25, color=colors[i], label=f'NC {nc}')
-
-    ax1.set_xlabel('Radio del Anión (R) [Å]')
-    ax1.set_ylabel('Relación r/R')
-    ax1.set_title(f'Variación de r/R para r = {radio_cation} Å constante')
-    ax1.legend(loc='upper right', fontsize=8)
-    ax1.grid(alpha=0.3)
-    st.pyplot(fig1)
-
-# --- GRÁFICA 2: Zoom didáctico con franjas + transición 2D/3D + etiquetas internas (auto-evitan curva) ---
-with col_grafica2:
-    st.markdown("**Vista de zoom – análisis detallado (gráfica principal)**")
-    margen = 1.0
-    x_min = max(0.1, radio_anion - margen)
-    x_max = radio_anion + margen
-
-    indices = [i for i, R in enumerate(R_range_full) if x_min <= R <= x_max]
-    if len(indices) == 0:
-        R_range_zoom = [x_min, x_max]
-        r_R_range_zoom = [radio_cation / x_min, radio_cation / x_max]
-    else:
-        R_range_zoom = [R_range_full[i] for i in indices]
-        r_R_range_zoom = [r_R_range_full[i] for i in indices]
-
-    fig2, ax2 = plt.subplots(figsize=(8, 5))
-    ax2.plot(R_range_zoom, r_R_range_zoom, 'b-', linewidth=2.5, label='r/R')
-
-    ax2.axhline(y=relacion_r_R, color='r', linestyle='--', alpha=0.7, linewidth=1.5,
-                label=f'Valor actual ({relacion_r_R:.2f})')
-    ax2.axvline(x=radio_anion, color='g', linestyle='--', alpha=0.7, linewidth=1.5,
-                label=f'R actual ({radio_anion:.2f} Å)')
-
-    # Transición 2D/3D: r/R=0.225 y R=r/0.225
-    R_transicion = radio_cation / 0.225
-    if x_min <= R_transicion <= x_max:
-        ax2.axvline(x=R_transicion, color='purple', linestyle='-.', linewidth=1.8, alpha=0.9,
-                    label=f'Transición 2D/3D (R={R_transicion:.2f} Å)')
-    ax2.axhline(y=0.225, color='purple', linestyle='-.', linewidth=1.8, alpha=0.9,
-                label='Límite 2D/3D (r/R = 0.225)')
-
-    # Franjas didácticas
-    ax2.axhspan(0.155, 0.225, alpha=0.40, color='#555555', hatch='///',
-                label='Región 2D (NC=3, planar)')
-    ax2.axhspan(0.225, 0.414, alpha=0.35, color=colors[1], label='NC 4')
-    ax2.axhspan(0.414, 0.732, alpha=0.35, color=colors[2], label='NC 6')
-    ax2.axhspan(0.732, 1.000, alpha=0.35, color=colors[3], label='NC 8')
-    if y_max_zoom > 1.0:
-        ax2.axhspan(1.000, y_max_zoom, alpha=0.35, color=colors[4], label='NC 12')
-
-    # Líneas auxiliares
-    ax2.axhline(y=0.155, color='black', linestyle='-', linewidth=1.0, alpha=0.5)
-    ax2.axhline(y=0.225, color='black', linestyle='-', linewidth=1.0, alpha=0.5)
-    for limite in [0.414, 0.732, 1.000]:
-        if limite <= y_max_zoom:
-            ax2.axhline(y=limite, color='gray', linestyle=':', alpha=0.4, linewidth=0.8)
-
-    # Etiquetas 2D / 3D
-    if y_min_zoom <= 0.19 <= y_max_zoom:
-        ax2.text(
-            x_min + 0.10, 0.19, '2D', fontsize=11, weight='bold', color='white',
-            bbox=dict(boxstyle='round', facecolor='#555555', alpha=0.85, edgecolor='none')
-        )
-    if y_min_zoom <= 0.30 <= y_max_zoom:
-        ax2.text(
-            x_min + 0.10, 0.30, '3D', fontsize=11, weight='bold', color='white',
-            bbox=dict(boxstyle='round', facecolor=colors[1], alpha=0.85, edgecolor='none')
-        )
-
-    # ✅ Quitar rótulos redundantes sobre las líneas (NC=3 y NC=4 en el borde derecho)
-    # (antes estaban aquí, ya NO los ponemos)
-
-    # ======================================================
-    # ✅ Etiquetas dentro de franjas con % + auto-desplazamiento
-    # ======================================================
-    x_candidates = [0.12, 0.55, 0.82]  # fracciones del ancho: izquierda, medio, derecha
-    y_tol = max(0.03, 0.04 * (y_max_zoom - y_min_zoom))  # tolerancia: evita tapar curva en zoom apretado
-
-    def _curve_y(x: float) -> float:
-        # curva azul: r/R = r / R
-        return (radio_cation / x) if x > 0 else 999.0
-
-    def _pick_x_away_from_curve(y_target: float) -> float:
-        # elige el primer x candidato donde la curva quede "lejos" de y_target
-        for frac in x_candidates:
-            x = x_min + frac * (x_max - x_min)
-            if abs(_curve_y(x) - y_target) > y_tol:
-                return x
-        # fallback: aléjate del punto de intersección (si cae en el rango)
-        x_at = (radio_cation / y_target) if y_target > 0 else (x_min + x_max) / 2
-        x_left = x_min + x_candidates[0] * (x_max - x_min)
-        x_right = x_min + x_candidates[-1] * (x_max - x_min)
-        return x_right if abs(x_right - x_at) > abs(x_left - x_at) else x_left
-
-    def _label_in_band(y_low, y_high, text, facecolor):
-        y_mid = 0.5 * (y_low + y_high)
-        if not (y_min_zoom <= y_mid <= y_max_zoom):
-            return
-
-        x = _pick_x_away_from_curve(y_mid)
-        y = y_mid
-
-        # Si aun así cae muy cerca de la curva, desplaza un poco dentro de la franja (sin salir)
-        yc = _curve_y(x)
-        if abs(y - yc) <= y_tol:
-            band_h = (y_high - y_low)
-            shift = 0.18 * band_h
-            # mover alejándose de la curva
-            if yc >= y:
-                y = max(y_low + 0.12 * band_h, y - shift)
-            else:
-                y = min(y_high - 0.12 * band_h, y + shift)
-
-        ax2.text(
-            x, y, text,
-            fontsize=10, weight='bold', color='white',
-            bbox=dict(boxstyle='round', facecolor=facecolor, alpha=0.85, edgecolor='none')
-        )
-
-    # Porcentajes (según tu tabla: rango relevante 0.155–1.000; excluye NC=12)
-    _label_in_band(0.155, 0.225, "NC=3 (8.3%)", "#555555")
-    _label_in_band(0.225, 0.414, "NC=4 (22.4%)", colors[1])
-    _label_in_band(0.414, 0.732, "NC=6 (37.6%)", colors[2])
-    _label_in_band(0.732, 1.000, "NC=8 (31.7%)", colors[3])
-    if y_max_zoom > 1.0:
-        _label_in_band(1.000, y_max_zoom, "NC=12", colors[4])
-
-    ax2.set_ylim(y_min_zoom, y_max_zoom)
-    ax2.set_xlim(x_min, x_max)
-    ax2.set_xlabel('Radio del Anión (R) [Å]')
-    ax2.set_ylabel('Relación r/R')
-    ax2.set_title(f'Zoom centrado en R = {radio_anion:.2f} Å')
-    ax2.legend(loc='upper right', fontsize=8)
-    ax2.grid(alpha=0.3)
-    st.pyplot(fig2)
-
-# ============================================================
-# 10. VISUALIZACIONES 3D — Embedding directo (SIN py3Dmol)
-# ============================================================
-st.subheader("🧊 Geometrías de coordinación en 3D")
-st.markdown("""
-Aquí se muestra **por defecto** la geometría correspondiente al **NC predicho** (según tus radios *r* y *R*).  
-Si quieres, puedes **explorar** (elegir NC) o **comparar todas** (modo didáctico).
-""")
-
-_vertices_por_nc = {3: VERTICES_NC3, 4: VERTICES_NC4, 6: VERTICES_NC6, 8: VERTICES_NC8, 12: VERTICES_NC12}
-
-def _xyz_from_vertices(nc: int, vertices_norm, R: float, r: float) -> tuple[str, list]:
-    dist = R + r
-    vertices = [[v[0]*dist, v[1]*dist, v[2]*dist] for v in vertices_norm]
-
-    n_atoms = nc + 1
-    lines = [str(n_atoms), f"NC={nc} ionic coordination (Na center, Cl ligands)"]
-    lines.append("Na 0.00000 0.00000 0.00000")
-    for (x, y, z) in vertices:
-        lines.append(f"Cl {x:.5f} {y:.5f} {z:.5f}")
-    return "\n".join(lines), vertices
-
-def _make_3dmol_embed_html(nc: int, R: float, r: float, etiqueta: str, ancho=560, alto=560) -> str:
-    vertices_norm = _vertices_por_nc[nc]
-    xyz, vertices = _xyz_from_vertices(nc, vertices_norm, R, r)
-
-    verts_js = json.dumps(vertices)
-    enlaces = vertices[:6] if nc == 12 else vertices
-    enlaces_js = json.dumps(enlaces)
-
-    etiqueta_html = (etiqueta.replace("\\n", "<br>").replace("\n", "<br>").replace('"', "&quot;"))
-    max_z = max([p[2] for p in vertices] + [0.0])
-    label_z = max_z + 2.2
-
-    html = f"""
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8"/>
-  <script src="https://3Dmol.org/build/3Dmol-min.js"></script>
-  <script src="https://3Dmol.org/build/3Dmol.ui-min.js"></script>
-  <style>
-    body {{ margin: 0; padding: 0; background: transparent; }}
-    #viewer {{ width: {ancho}px; height: {alto}px; position: relative; }}
-  </style>
-</head>
-<body>
-
-<pre id="moldata" style="display:none;">{xyz}</pre>
-
-<div id="viewer"
-     class="viewer_3Dmoljs"
-     data-element="moldata"
-     data-type="xyz"
-     data-backgroundcolor="#ffffff"
-     data-ui="true"
-     data-callback="onViewerCreated">
-</div>
-
-<script>
-function onViewerCreated(viewer) {{
-  const R = {R};
-  const r = {r};
-  const verts = {verts_js};
-  const bonds = {enlaces_js};
-
-  function addAxesLike(viewer, L) {{
-    viewer.addCylinder({{start:{{x:0,y:0,z:0}}, end:{{x:L,y:0,z:0}}, radius:0.03, color:"red"}});
-    viewer.addCylinder({{start:{{x:0,y:0,z:0}}, end:{{x:0,y:L,z:0}}, radius:0.03, color:"green"}});
-    viewer.addCylinder({{start:{{x:0,y:0,z:0}}, end:{{x:0,y:0,z:L}}, radius:0.03, color:"blue"}});
-  }}
-
-  function draw() {{
-    try {{
-      if (viewer.removeAllShapes) viewer.removeAllShapes();
-      if (viewer.removeAllLabels) viewer.removeAllLabels();
-
-      if (viewer.setStyle) {{
-        viewer.setStyle({{}}, {{sphere: {{scale: 1.0}}}});
-        viewer.setStyle({{elem:"Cl"}}, {{sphere: {{scale: 1.0, color:"red", opacity:0.80}}}});
-        viewer.setStyle({{elem:"Na"}}, {{sphere: {{scale: 1.0, color:"blue", opacity:1.00}}}});
-      }}
-
-      addAxesLike(viewer, 1.2);
-
-      verts.forEach(v => {{
-        viewer.addSphere({{
-          center: {{x: v[0], y: v[1], z: v[2]}},
-          radius: R,
-          color: "red",
-          alpha: 0.80
-        }});
-      }});
-
-      viewer.addSphere({{
-        center: {{x: 0, y: 0, z: 0}},
-        radius: r,
-        color: "blue",
-        alpha: 1.00
-      }});
-
-      bonds.forEach(v => {{
-        viewer.addCylinder({{
-          start: {{x:0, y:0, z:0}},
-          end: {{x:v[0], y:v[1], z:v[2]}},
-          radius: 0.05,
-          color: "gray"
-        }});
-      }});
-
-      viewer.addLabel("{etiqueta_html}", {{
-        position: {{x: 0, y: 0, z: {label_z}}},
-        fontSize: 16,
-        fontColor: "black",
-        backgroundColor: "white",
-        backgroundOpacity: 0.85,
-        inFront: true
-      }});
-
-      if (viewer.zoomTo) viewer.zoomTo();
-      if (viewer.render) viewer.render();
-
-      setTimeout(() => {{
-        if (viewer.resize) viewer.resize();
-        if (viewer.render) viewer.render();
-      }}, 50);
-
-      console.log("✅ draw() OK: spheres should be visible");
-    }} catch (e) {{
-      console.error("❌ draw() error:", e);
-      try {{
-        console.log("viewer keys:", Object.keys(viewer));
-        console.log("typeof addSphere:", typeof viewer.addSphere);
-        console.log("typeof addCylinder:", typeof viewer.addCylinder);
-      }} catch (_) {{}}
-    }}
-  }}
-
-  let tries = 0;
-  const timer = setInterval(() => {{
-    tries++;
-    try {{
-      const m = viewer.getModel ? viewer.getModel() : null;
-      const ok = (m && m.selectedAtoms && m.selectedAtoms({{}}).length > 0);
-      if (ok || tries > 120) {{
-        clearInterval(timer);
-        draw();
-      }}
-    }} catch (e) {{
-      if (tries > 120) {{
-        clearInterval(timer);
-        draw();
-      }}
-    }}
-  }}, 25);
-}}
-</script>
-
-</body>
-</html>
-"""
-    return html
-
-modo = st.radio(
-    "Modo de visualización",
-    options=[
-        "Mostrar solo la estructura predicha (según r/R)",
-        "Explorar (elegir NC manualmente)",
-        "Comparar todas (3×2)"
-    ],
-    index=0,
-    horizontal=True
-)
-
-if modo == "Explorar (elegir NC manualmente)":
-    nc_elegido = st.selectbox("Selecciona un NC para explorar", NC_TIPICOS, index=NC_TIPICOS.index(nc_predicho))
-else:
-    nc_elegido = nc_predicho
-
-visores = {nc: "" for nc in NC_TIPICOS}
-
-if modo == "Comparar todas (3×2)":
-    R_ANION_FIJO = 1.0
-    r_R_representativo = {3: 0.19, 4: 0.30, 6: 0.50, 8: 0.80, 12: 0.90}
-
-    for nc in NC_TIPICOS:
-        idx = NC_TIPICOS.index(nc)
-        if nc == 3:
-            intervalo = "0.155–0.225"
-        elif nc == 12:
-            intervalo = ">0.732"
-        else:
-            intervalo = f"{LIMITES_NC[idx-1]:.3f}–{LIMITES_NC[idx]:.3f}"
-
-        etiqueta = f"NC = {nc}\\n{GEOMETRIAS[idx]}\\nr/R: {intervalo}"
-        r_rep = r_R_representativo[nc] * R_ANION_FIJO
-
-        visores[nc] = _make_3dmol_embed_html(nc, R_ANION_FIJO, r_rep, etiqueta, ancho=450, alto=450)
-
-    st.success("Modo comparar activado: se renderizan todas las geometrías (3×2).")
-
-else:
-    idx = NC_TIPICOS.index(nc_elegido)
-    etiqueta = (
-        f"NC = {nc_elegido}\\n"
-        f"{GEOMETRIAS[idx]}\\n"
-        f"r = {radio_cation:.2f} Å\\n"
-        f"R = {radio_anion:.2f} Å\\n"
-        f"r/R = {relacion_r_R:.3f}"
-    )
-
-    visores[nc_elegido] = _make_3dmol_embed_html(nc_elegido, radio_anion, radio_cation, etiqueta, ancho=560, alto=560)
-
-    if nc_elegido == nc_predicho:
-        st.markdown('<div style="border: 3px solid gold; padding: 8px; border-radius: 12px;">', unsafe_allow_html=True)
-
-    st.markdown(f"### ✅ Geometría mostrada: **NC = {nc_elegido}** · *{GEOMETRIAS[idx]}*")
-    st.components.v1.html(visores[nc_elegido], height=580)
-
-    if nc_elegido == nc_predicho:
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    st.caption("⚠️ NC=6: Es muy común en muchos sólidos iónicos, es geométricamente ‘robusta’. ⚠️ NC=12: Límite de empaquetamiento (r≈R); en sales binarias típicas la regla r/R suele no ser aplicable estrictamente—úsalo como guía didáctica. ⚠️ Cuanto más amplio es el intervalo geométrico, mayor suele ser la tolerancia a variaciones de radios (por polarización, distorsiones y mezclas iónico–covalente). ⚠️ La coordinación real dependerá también de energía de la red y de la química específica")
-
-# ============================================================
-# 11. DISPOSICIÓN EN CUADRÍCULA 3x2 (solo en modo comparar)
-# ============================================================
-if modo == "Comparar todas (3×2)":
-    st.subheader("🧩 Cuadrícula 3×2 (comparación didáctica)")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("**NC = 3**  ·  *Triangular*")
-        st.components.v1.html(visores[3], height=450)
-    with col2:
-        st.markdown("**NC = 4**  ·  *Tetraédrica*")
-        st.components.v1.html(visores[4], height=450)
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("**NC = 6**  ·  *Octaédrica*")
-        st.components.v1.html(visores[6], height=450)
-    with col2:
-        st.markdown("**NC = 8**  ·  *Cúbica*")
-        st.components.v1.html(visores[8], height=450)
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("**NC = 12**  ·  *Cuboctaédrica (Compacta)*")
-        st.components.v1.html(visores[12], height=450)
-    with col2:
-        st.markdown("""
-        <div style="background-color: #f0f2f6; padding: 20px; border-radius: 10px; height: 450px; display: flex; flex-direction: column; justify-content: center;">
-            <h4 style="text-align: center;">📘 Información</h4>
-            <p style="text-align: center;">
-            <span style="color:blue;">● Catión (central)</span><br>
-            <span style="color:red;">● Aniones (coordinados)</span><br><br>
-            hader.martinez@upb.edu.co.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-else:
-    st.caption("Curso Ciencia de Los Materiales")
-
-# ============================================================
-# 12. PIE DE PÁGINA
-# ============================================================
-st.caption("©️2025 H. Vladimir Martínez-Tejada. Basado en las reglas de radios de Pauling. Visualizaciones 3D con 3Dmol.js (embedding directo). Código y contenido: CC BY 4.0 (atribución requerida).")
-
-
-
-
-
-
-
+import streamlit as st
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # backend sin GUI: evita sondear Tk al importar
+# Simplificación de trazos en el rasterizado: colapsa vértices colineales
+# antes de dibujar, sin cambio visible a dpi=80
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.patches import Patch
+import matplotlib.cm as cm
+import numpy as np
+import json
+import io
+import string
+import base64
+import html
+
+# orjson (opcional): serializador JSON en C, varias veces más rápido que la
+# stdlib para las listas de vértices; si no está instalado se usa json
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+# ============================================================
+# 1. CONFIGURACIÓN INICIAL
+# ============================================================
+st.set_page_config(page_title="Simulador r/R - NC", layout="wide")
+
+TEORIA_MD = """
+**Teoría:** Esta app visualiza cómo la relación entre el radio del catión (r) y el anión (R) 
+determina el número de coordinación (NC) estable en un sólido iónico, asumiendo el modelo de esferas rígidas.
+"""
+
+INTRO_3D_MD = """
+Aquí se muestra **por defecto** la geometría correspondiente al **NC predicho** (según tus radios *r* y *R*).  
+Si quieres, puedes **explorar** (elegir NC) o **comparar todas** (modo didáctico).
+"""
+
+NOTAS_NC_CAPTION = ("⚠️ NC=6: Es muy común en muchos sólidos iónicos, es geométricamente ‘robusta’. "
+                    "⚠️ NC=12: Límite de empaquetamiento (r≈R); en sales binarias típicas la regla r/R suele no ser "
+                    "aplicable estrictamente—úsalo como guía didáctica. ⚠️ Cuanto más amplio es el intervalo "
+                    "geométrico, mayor suele ser la tolerancia a variaciones de radios (por polarización, "
+                    "distorsiones y mezclas iónico–covalente). ⚠️ La coordinación real dependerá también de "
+                    "energía de la red y de la química específica")
+
+st.title("📐 Simulador de Relación de Radios y Número de Coordinación")
+st.markdown(TEORIA_MD)
+
+# ============================================================
+# 2. DEFINICIÓN DE CONSTANTES Y LÍMITES
+# ============================================================
+LIMITES_NC = [0.155, 0.225, 0.414, 0.732, 1.000]
+NC_TIPICOS = [3, 4, 6, 8, 12]
+GEOMETRIAS = ["Triangular", "Tetraédrica", "Octaédrica", "Cúbica", "Cuboctaédrica (Compacta)"]
+
+# Información por NC precalculada: (posición en las listas, geometría, intervalo
+# r/R mostrado); evita búsquedas lineales con .index() en los puntos de uso
+NC_INFO = {
+    nc: (i, GEOMETRIAS[i],
+         "0.155–0.225" if nc == 3 else ">0.732" if nc == 12
+         else f"{LIMITES_NC[i-1]:.3f}–{LIMITES_NC[i]:.3f}")
+    for i, nc in enumerate(NC_TIPICOS)
+}
+
+# Cadena de marcadores de límites: depende solo de constantes, se formatea una vez
+MARCADORES = " | ".join(f"{limite:.3f} (NC={nc})" for limite, nc in zip(LIMITES_NC, NC_TIPICOS))
+
+# Rejilla de R para las curvas: ndarray contiguo construido una sola vez al importar
+R_RANGE_FULL = np.arange(10, 701, dtype=np.float64) / 100.0
+
+# Rejilla gruesa para la vista completa: 80 puntos en progresión geométrica
+# (más densos cerca de 0.1, donde la hipérbola se curva); la rejilla densa se
+# reserva para la ventana de zoom de la gráfica derecha
+R_RANGE_FIG1 = np.geomspace(0.1, 7.0, 80)
+
+# Copia ndarray de los límites para las búsquedas binarias de searchsorted
+LIMITES_NC_ARR = np.asarray(LIMITES_NC)
+
+def clasificar_nc(ratios):
+    """Índice de NC_TIPICOS para una o varias relaciones r/R.
+
+    Acepta un escalar o un array (p. ej. una rejilla de parejas r×R para un
+    barrido de parámetros) y lo resuelve con una sola búsqueda binaria
+    vectorizada, conservando la frontera estricta "relacion < limite".
+    """
+    idx = np.searchsorted(LIMITES_NC_ARR, np.asarray(ratios), side='right')
+    return np.minimum(idx, len(NC_TIPICOS) - 1)
+
+# Paleta de colores Viridis
+@st.cache_resource
+def _palette():
+    """Un color por NC; una sola llamada vectorizada al colormap, una vez por proceso."""
+    return [tuple(c) for c in cm.viridis(np.linspace(0.0, 1.0, len(NC_TIPICOS)))]
+
+colors = _palette()
+
+# Franjas de NC precalculadas: (y0, y1, color, etiqueta), compartidas entre figuras
+NC_BANDS = [(0.0 if i == 0 else LIMITES_NC[i-1], LIMITES_NC[i], colors[i], f'NC {nc}')
+            for i, nc in enumerate(NC_TIPICOS)]
+
+# Franjas didácticas de la vista de zoom: (y0, y1, color, hatch, etiqueta, alfa);
+# y1 = None marca la franja abierta que se extiende hasta el límite superior del zoom
+ZOOM_BANDS = [
+    (0.155, 0.225, '#555555', '///', 'Región 2D (NC=3, planar)', 0.40),
+    (0.225, 0.414, colors[1], None, 'NC 4', 0.35),
+    (0.414, 0.732, colors[2], None, 'NC 6', 0.35),
+    (0.732, 1.000, colors[3], None, 'NC 8', 0.35),
+    (1.000, None, colors[4], None, 'NC 12', 0.35),
+]
+
+# Divisores horizontales grises de la vista de zoom (los que caen en ventana)
+_DIVISORES_GRIS = np.array([0.414, 0.732, 1.000])
+
+@st.cache_data
+def _build_limites_df() -> pd.DataFrame:
+    """Tabla de umbrales r/R; se construye una sola vez y se reutiliza en cada rerun."""
+    return pd.DataFrame({"NC": NC_TIPICOS, "Geometría": GEOMETRIAS, "Límite inferior r/R": LIMITES_NC})
+
+# ============================================================
+# 3. DEFINICIÓN DE VÉRTICES NORMALIZADOS (distancia = 1)
+# ============================================================
+@st.cache_resource
+def _build_vertices() -> dict[int, np.ndarray]:
+    """Tablas de vértices normalizados por NC, construidas una vez por proceso:
+    los reruns del script reutilizan los mismos ndarrays en lugar de reevaluar
+    los literales."""
+    VERTICES_NC3 = np.array([
+        [1.0, 0.0, 0.0],
+        [-0.5, np.sqrt(3)/2, 0.0],
+        [-0.5, -np.sqrt(3)/2, 0.0]
+    ])
+
+    VERTICES_NC4 = np.array([
+        [1, 1, 1],
+        [1, -1, -1],
+        [-1, 1, -1],
+        [-1, -1, 1]
+    ], dtype=np.float64) / np.sqrt(3)
+
+    VERTICES_NC6 = np.array([
+        [1, 0, 0], [-1, 0, 0],
+        [0, 1, 0], [0, -1, 0],
+        [0, 0, 1], [0, 0, -1]
+    ], dtype=np.float64)
+
+    VERTICES_NC8 = np.array([
+        [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
+        [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1]
+    ], dtype=np.float64) / np.sqrt(3)
+
+    # Cuboctaedro: las 12 permutaciones con signo de (±1, ±1, 0), en el mismo orden
+    # que generaba el antiguo bucle (los enlaces del NC=12 usan las 6 primeras filas)
+    VERTICES_NC12 = np.array([
+        [-1, -1, 0], [-1, 1, 0], [1, -1, 0], [1, 1, 0],
+        [0, -1, -1], [0, -1, 1], [0, 1, -1], [0, 1, 1],
+        [-1, 0, -1], [1, 0, -1], [-1, 0, 1], [1, 0, 1],
+    ], dtype=np.float64) / np.sqrt(2)
+
+    return {3: VERTICES_NC3, 4: VERTICES_NC4, 6: VERTICES_NC6,
+            8: VERTICES_NC8, 12: VERTICES_NC12}
+
+_vertices_por_nc = _build_vertices()
+
+# ============================================================
+# 4. INTERFAZ DE USUARIO (Sidebar)
+# ============================================================
+with st.sidebar:
+    st.header("⚙️ Controles de los Radios Iónicos")
+    st.caption("Ajusta los valores en Ångströms (Å).")
+
+    # Modo continuo: cada tick del arrastre provoca un rerun (máquinas rápidas);
+    # desactivado, el formulario agrupa los cambios tras "Aplicar radios"
+    modo_continuo = st.checkbox(
+        "Modo continuo (actualizar al arrastrar)", value=False,
+        help="Actívalo para ver los resultados sin pulsar el botón Aplicar."
+    )
+
+    def _sliders_radios():
+        r = st.slider(
+            "Radio del Catión (r) [Å]",
+            min_value=0.1, max_value=2.0, value=1.0, step=0.01,
+            help="Selecciona el radio del catión central."
+        )
+        R = st.slider(
+            "Radio del Anión (R) [Å]",
+            min_value=0.1, max_value=7.0, value=1.4, step=0.01,
+            help="Varía este control para simular aniones de diferente tamaño."
+        )
+        return r, R
+
+    if modo_continuo:
+        radio_cation, radio_anion = _sliders_radios()
+    else:
+        # Formulario: el rerun ocurre al pulsar "Aplicar", no en cada tick del arrastre
+        with st.form("controles_radios", border=False):
+            radio_cation, radio_anion = _sliders_radios()
+            st.form_submit_button("✅ Aplicar radios")
+
+# ============================================================
+# 5. CÁLCULO PRINCIPAL
+# ============================================================
+relacion_r_R = radio_cation / radio_anion if radio_anion > 0 else 0
+
+# Clasificación por búsqueda binaria (misma rutina que serviría a un barrido por lotes)
+idx_nc = int(clasificar_nc(relacion_r_R))
+nc_predicho = NC_TIPICOS[idx_nc]
+geometria_predicha = GEOMETRIAS[idx_nc]
+
+# ============================================================
+# 6-8. RESULTADOS Y GRÁFICOS (fragmento reactivo a los sliders)
+# ============================================================
+@st.cache_data(max_entries=32, show_spinner=False)
+def _rR_curve(radio_cation: float) -> np.ndarray:
+    """Curva r/R sobre la rejilla completa; depende solo del radio del catión,
+    así que los reruns por el slider del anión o del zoom la reutilizan."""
+    return radio_cation / R_RANGE_FULL
+
+def _draw_nc_bands(ax, alpha=0.25):
+    """Franjas estáticas de NC: el mismo fondo en cualquier figura que lo use.
+
+    Las cinco franjas van en una sola PolyCollection (un artista en la lista de
+    dibujo en vez de cinco parches); como la colección no lleva etiqueta, se
+    devuelven parches proxy para que la leyenda las siga mostrando.
+    """
+    verts = [[(0.0, y0), (1.0, y0), (1.0, y1), (0.0, y1)] for y0, y1, _, _ in NC_BANDS]
+    bandas = PolyCollection(verts,
+                            facecolors=[c for _, _, c, _ in NC_BANDS],
+                            alpha=alpha, edgecolors='none', zorder=1,
+                            transform=ax.get_yaxis_transform())
+    ax.add_collection(bandas, autolim=False)
+    return [Patch(facecolor=c, alpha=alpha, label=etiqueta)
+            for _, _, c, etiqueta in NC_BANDS]
+
+# --- GRÁFICA 1: Vista completa ---
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_fig1(radio_cation: float, radio_anion: float):
+    """Figura de vista completa, cacheada por pareja de radios."""
+    relacion_r_R = radio_cation / radio_anion
+    # Conversiones float->str hechas una vez y reutilizadas en las etiquetas
+    fmt = {'ratio2': f"{relacion_r_R:.2f}", 'R2': f"{radio_anion:.2f}"}
+    fig1 = Figure(figsize=(8, 5))
+    ax1 = fig1.subplots()
+    ax1.plot(R_RANGE_FIG1, radio_cation / R_RANGE_FIG1, 'b-', linewidth=2.5, label='r/R')
+    ax1.axhline(y=relacion_r_R, color='r', linestyle='--', alpha=0.7, linewidth=1.5,
+                label=f"Valor actual ({fmt['ratio2']})")
+    ax1.axvline(x=radio_anion, color='g', linestyle='--', alpha=0.7, linewidth=1.5,
+                label=f"R actual ({fmt['R2']} Å)")
+
+    proxies_bandas = _draw_nc_bands(ax1)
+
+    ax1.set_xlabel('Radio del Anión (R) [Å]')
+    ax1.set_ylabel('Relación r/R')
+    ax1.set_title(f'Variación de r/R para r = {radio_cation} Å constante')
+    handles, _ = ax1.get_legend_handles_labels()
+    ax1.legend(handles=handles + proxies_bandas, loc='upper right', fontsize=8)
+    ax1.grid(alpha=0.3)
+    return fig1
+
+# --- GRÁFICA 2: Zoom didáctico con franjas + transición 2D/3D + etiquetas internas (auto-evitan curva) ---
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_fig2(radio_cation: float, radio_anion: float, y_min_zoom: float, y_max_zoom: float):
+    """Figura de zoom, cacheada por radios y por los límites verticales del eje Y."""
+    relacion_r_R = radio_cation / radio_anion
+    r_R_range_full = _rR_curve(radio_cation)
+    margen = 1.0
+    x_min = max(0.1, radio_anion - margen)
+    x_max = radio_anion + margen
+
+    # La rejilla está ordenada: dos bisecciones y un slice (vistas, sin copia)
+    lo = np.searchsorted(R_RANGE_FULL, x_min, side='left')
+    hi = np.searchsorted(R_RANGE_FULL, x_max, side='right')
+    if hi <= lo:
+        R_range_zoom = np.array([x_min, x_max])
+        r_R_range_zoom = radio_cation / R_range_zoom
+    else:
+        R_range_zoom = R_RANGE_FULL[lo:hi]
+        r_R_range_zoom = r_R_range_full[lo:hi]
+
+    fig2 = Figure(figsize=(8, 5))
+    ax2 = fig2.subplots()
+    ax2.plot(R_range_zoom, r_R_range_zoom, 'b-', linewidth=2.5, label='r/R')
+
+    # Conversiones float->str hechas una vez y reutilizadas en etiquetas y título
+    fmt = {'ratio2': f"{relacion_r_R:.2f}", 'R2': f"{radio_anion:.2f}"}
+    ax2.axhline(y=relacion_r_R, color='r', linestyle='--', alpha=0.7, linewidth=1.5,
+                label=f"Valor actual ({fmt['ratio2']})")
+    ax2.axvline(x=radio_anion, color='g', linestyle='--', alpha=0.7, linewidth=1.5,
+                label=f"R actual ({fmt['R2']} Å)")
+
+    # Transición 2D/3D: r/R=0.225 y R=r/0.225
+    R_transicion = radio_cation / 0.225
+    if x_min <= R_transicion <= x_max:
+        ax2.axvline(x=R_transicion, color='purple', linestyle='-.', linewidth=1.8, alpha=0.9,
+                    label=f'Transición 2D/3D (R={R_transicion:.2f} Å)')
+    ax2.axhline(y=0.225, color='purple', linestyle='-.', linewidth=1.8, alpha=0.9,
+                label='Límite 2D/3D (r/R = 0.225)')
+
+    # Franjas didácticas: un solo bucle sobre la tabla, saltando las que quedan
+    # por completo fuera de la ventana vertical
+    for y0, y1, color_franja, hatch, etiqueta_franja, alfa in ZOOM_BANDS:
+        y1 = y_max_zoom if y1 is None else y1
+        if y0 >= y_max_zoom or y1 <= y0:
+            continue
+        ax2.axhspan(y0, y1, alpha=alfa, color=color_franja, hatch=hatch,
+                    label=etiqueta_franja)
+
+    # Líneas auxiliares: los divisores grises visibles van en una sola
+    # LineCollection en vez de un axhline (artista Line2D) por límite
+    ax2.axhline(y=0.155, color='black', linestyle='-', linewidth=1.0, alpha=0.5)
+    ax2.axhline(y=0.225, color='black', linestyle='-', linewidth=1.0, alpha=0.5)
+    divisores = _DIVISORES_GRIS[_DIVISORES_GRIS <= y_max_zoom]
+    if divisores.size:
+        ax2.add_collection(LineCollection(
+            [[(x_min, y), (x_max, y)] for y in divisores],
+            colors='gray', linestyles=':', alpha=0.4, linewidths=0.8,
+        ), autolim=False)
+
+    # Etiquetas 2D / 3D
+    if y_min_zoom <= 0.19 <= y_max_zoom:
+        ax2.text(
+            x_min + 0.10, 0.19, '2D', fontsize=11, weight='bold', color='white',
+            bbox=dict(boxstyle='round', facecolor='#555555', alpha=0.85, edgecolor='none')
+        )
+    if y_min_zoom <= 0.30 <= y_max_zoom:
+        ax2.text(
+            x_min + 0.10, 0.30, '3D', fontsize=11, weight='bold', color='white',
+            bbox=dict(boxstyle='round', facecolor=colors[1], alpha=0.85, edgecolor='none')
+        )
+
+    # ✅ Quitar rótulos redundantes sobre las líneas (NC=3 y NC=4 en el borde derecho)
+    # (antes estaban aquí, ya NO los ponemos)
+
+    # ======================================================
+    # ✅ Etiquetas dentro de franjas con % + auto-desplazamiento
+    # ======================================================
+    # Candidatos de x (izquierda, medio, derecha) y sus alturas de curva, en bloque
+    x_candidates = x_min + np.array([0.12, 0.55, 0.82]) * (x_max - x_min)
+    y_curva_candidatos = radio_cation / x_candidates  # x_min >= 0.1 > 0
+    y_tol = max(0.03, 0.04 * (y_max_zoom - y_min_zoom))  # tolerancia: evita tapar curva en zoom apretado
+
+    def _curve_y(x: float) -> float:
+        # curva azul: r/R = r / R
+        return (radio_cation / x) if x > 0 else 999.0
+
+    def _pick_x_away_from_curve(y_target: float) -> float:
+        # primer x candidato donde la curva queda "lejos" de y_target, en una comparación vectorizada
+        mask = np.abs(y_curva_candidatos - y_target) > y_tol
+        if mask.any():
+            return float(x_candidates[mask.argmax()])
+        # fallback: aléjate del punto de intersección (si cae en el rango)
+        x_at = (radio_cation / y_target) if y_target > 0 else (x_min + x_max) / 2
+        x_left, x_right = x_candidates[0], x_candidates[-1]
+        return float(x_right if abs(x_right - x_at) > abs(x_left - x_at) else x_left)
+
+    def _label_in_band(y_low, y_high, text, facecolor):
+        y_mid = 0.5 * (y_low + y_high)
+        if not (y_min_zoom <= y_mid <= y_max_zoom):
+            return
+
+        x = _pick_x_away_from_curve(y_mid)
+        y = y_mid
+
+        # Si aun así cae muy cerca de la curva, desplaza un poco dentro de la franja (sin salir)
+        yc = _curve_y(x)
+        if abs(y - yc) <= y_tol:
+            band_h = (y_high - y_low)
+            shift = 0.18 * band_h
+            # mover alejándose de la curva
+            if yc >= y:
+                y = max(y_low + 0.12 * band_h, y - shift)
+            else:
+                y = min(y_high - 0.12 * band_h, y + shift)
+
+        ax2.text(
+            x, y, text,
+            fontsize=10, weight='bold', color='white',
+            bbox=dict(boxstyle='round', facecolor=facecolor, alpha=0.85, edgecolor='none')
+        )
+
+    # Porcentajes (según tu tabla: rango relevante 0.155–1.000; excluye NC=12)
+    _label_in_band(0.155, 0.225, "NC=3 (8.3%)", "#555555")
+    _label_in_band(0.225, 0.414, "NC=4 (22.4%)", colors[1])
+    _label_in_band(0.414, 0.732, "NC=6 (37.6%)", colors[2])
+    _label_in_band(0.732, 1.000, "NC=8 (31.7%)", colors[3])
+    if y_max_zoom > 1.0:
+        _label_in_band(1.000, y_max_zoom, "NC=12", colors[4])
+
+    ax2.set_ylim(y_min_zoom, y_max_zoom)
+    ax2.set_xlim(x_min, x_max)
+    ax2.set_xlabel('Radio del Anión (R) [Å]')
+    ax2.set_ylabel('Relación r/R')
+    ax2.set_title(f"Zoom centrado en R = {fmt['R2']} Å")
+    ax2.legend(loc='upper right', fontsize=8)
+    ax2.grid(alpha=0.3)
+    return fig2
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _fig1_png(radio_cation: float, radio_anion: float) -> bytes:
+    """PNG de la figura 1; en un rerun con los mismos radios no se toca matplotlib."""
+    fig = _build_fig1(radio_cation, radio_anion)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=80, bbox_inches="tight")
+    return buf.getvalue()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _fig2_png(radio_cation: float, radio_anion: float, y_min_zoom: float, y_max_zoom: float) -> bytes:
+    fig = _build_fig2(radio_cation, radio_anion, y_min_zoom, y_max_zoom)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=80, bbox_inches="tight")
+    return buf.getvalue()
+
+def _reset_zoom():
+    # El callback corre antes del rerun natural del clic: un solo ciclo,
+    # sin el st.rerun() forzado (y sin asignaciones locales muertas)
+    st.session_state["y_max_zoom"] = 1.1
+    st.session_state["y_min_zoom"] = 0.0
+
+@st.fragment
+def _panel_zoom(key_cat: float, key_an: float):
+    """Sliders de zoom y su gráfica en un mismo fragmento: arrastrar el zoom
+    re-ejecuta solo este panel, sin regenerar métricas ni la vista completa."""
+    # El valor inicial vive solo en session_state: pasar además un default
+    # posicional haría que cada reset dispare el aviso de Streamlit sobre
+    # widgets con default y valor vía Session State API a la vez
+    st.session_state.setdefault("y_max_zoom", 1.1)
+    st.session_state.setdefault("y_min_zoom", 0.0)
+    y_max_zoom = st.slider("Límite superior del eje Y", 0.2, 2.0, step=0.05, key="y_max_zoom")
+    y_min_zoom = st.slider("Límite inferior del eje Y", 0.0, 0.5, step=0.05, key="y_min_zoom")
+    st.button("🔄 Restablecer zoom vertical", on_click=_reset_zoom)
+    st.image(_fig2_png(key_cat, key_an, round(y_min_zoom, 2), round(y_max_zoom, 2)), width="stretch")
+
+@st.fragment
+def _seccion_resultados(radio_cation, radio_anion, relacion_r_R,
+                        nc_predicho, geometria_predicha):
+    """Métricas, tabla y gráficas: la parte del UI que reacciona a los sliders.
+
+    Al ser un fragmento, las interacciones con widgets de otras secciones no
+    vuelven a ejecutar este bloque completo.
+    """
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Relación r/R", f"{relacion_r_R:.3f}")
+    with col2:
+        st.metric("Número de Coordinación (NC)", nc_predicho)
+    with col3:
+        st.metric("Geometría", geometria_predicha)
+
+    st.subheader("📊 Umbrales de Estabilidad para cada NC")
+    df_limites = _build_limites_df()
+    st.dataframe(df_limites, width="stretch", hide_index=True)
+
+    st.markdown(f"**Posición actual de r/R ({relacion_r_R:.3f}) en la escala:**")
+    posicion_relativa = min(relacion_r_R / 1.1, 1.0)
+    st.progress(posicion_relativa)
+
+    st.caption(f"**Límites:** {MARCADORES}")
+
+    st.subheader("📈 Relación entre R y r/R")
+    col_grafica1, col_grafica2 = st.columns(2)
+
+    # Claves cuantizadas al paso de los sliders: sin esto el ruido flotante de dos
+    # valores "iguales" produciría entradas de caché distintas para la misma figura.
+    key_cat = round(radio_cation, 2)
+    key_an = round(radio_anion, 2)
+
+    with col_grafica1:
+        st.markdown("**Vista completa – modelo extendido**")
+        st.image(_fig1_png(key_cat, key_an), width="stretch")
+
+    with col_grafica2:
+        st.markdown("**Vista de zoom – análisis detallado (gráfica principal)**")
+        _panel_zoom(key_cat, key_an)
+
+_seccion_resultados(radio_cation, radio_anion, relacion_r_R,
+                    nc_predicho, geometria_predicha)
+
+# ============================================================
+# 10-11. VISUALIZACIONES 3D — Embedding directo (SIN py3Dmol)
+# ============================================================
+def _etiqueta_html(etiqueta: str) -> str:
+    """Etiqueta segura para el HTML embebido: escape estándar y saltos de línea
+    (tanto los reales como los escritos como literal \\n) convertidos a <br>."""
+    return html.escape(etiqueta, quote=True).replace("\\n", "<br>").replace("\n", "<br>")
+
+# Cabeceras XYZ por NC: dependen solo de NC, así que se formatean una vez al importar
+_XYZ_HEADERS = {
+    nc: f"{nc + 1}\nNC={nc} ionic coordination (Na center, Cl ligands)\n"
+        "Na 0.00000 0.00000 0.00000\n"
+    for nc in NC_TIPICOS
+}
+
+def _xyz_from_vertices(nc: int, vertices_norm, R: float, r: float) -> tuple[str, np.ndarray]:
+    # Escalado vectorizado: una multiplicación de array en lugar de bucles anidados
+    vertices = np.asarray(vertices_norm) * (R + r)
+
+    # Cuerpo XYZ formateado de una vez con savetxt (sin bucle de f-strings por átomo)
+    buf = io.StringIO()
+    buf.write(_XYZ_HEADERS[nc])
+    np.savetxt(buf, vertices, fmt="Cl %.5f %.5f %.5f")
+    return buf.getvalue().rstrip("\n"), vertices
+
+# Plantilla del visor 3D precompilada una vez: la sustitución por llamada es
+# un único pase sobre la cadena en lugar de re-interpolar un f-string multikilobyte
+_EMBED_TMPL = string.Template("""
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8"/>
+  <script src="https://cdn.jsdelivr.net/npm/3dmol@2.4.2/build/3Dmol-min.js" crossorigin="anonymous"></script>
+  <script src="https://cdn.jsdelivr.net/npm/3dmol@2.4.2/build/3Dmol.ui-min.js" crossorigin="anonymous"></script>
+  <style>
+    body { margin: 0; padding: 0; background: transparent; }
+    #viewer { width: ${ancho}px; height: ${alto}px; position: relative; }
+  </style>
+</head>
+<body>
+
+<pre id="moldata" style="display:none;">${xyz}</pre>
+
+<div id="viewer"
+     class="viewer_3Dmoljs"
+     data-element="moldata"
+     data-type="xyz"
+     data-backgroundcolor="#ffffff"
+     data-ui="true"
+     data-callback="onViewerCreated">
+</div>
+
+<script>
+function onViewerCreated(viewer) {
+  const R = ${R};
+  const r = ${r};
+  const bonds = ${enlaces_js};
+
+  function addAxesLike(viewer, L) {
+    viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:L,y:0,z:0}, radius:0.03, color:"red"});
+    viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:0,y:L,z:0}, radius:0.03, color:"green"});
+    viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:0,y:0,z:L}, radius:0.03, color:"blue"});
+  }
+
+  function draw() {
+    try {
+      if (viewer.removeAllShapes) viewer.removeAllShapes();
+      if (viewer.removeAllLabels) viewer.removeAllLabels();
+
+      // Esferas como estilo de átomos: 3Dmol las agrupa en una sola malla,
+      // en vez de crear un GLShape por cada addSphere
+      if (viewer.setStyle) {
+        viewer.setStyle({elem:"Cl"}, {sphere: {radius: R, color:"red", opacity:0.80}});
+        viewer.setStyle({elem:"Na"}, {sphere: {radius: r, color:"blue", opacity:1.00}});
+      }
+
+      addAxesLike(viewer, 1.2);
+
+      bonds.forEach(v => {
+        // El tramo interior queda oculto por el catión: el cilindro arranca en su superficie
+        const len = Math.hypot(v[0], v[1], v[2]);
+        const k = len > 0 ? r / len : 0;
+        viewer.addCylinder({
+          start: {x: v[0]*k, y: v[1]*k, z: v[2]*k},
+          end: {x: v[0], y: v[1], z: v[2]},
+          radius: 0.05,
+          color: "gray"
+        });
+      });
+
+      viewer.addLabel("${etiqueta_html}", {
+        position: {x: 0, y: 0, z: ${label_z}},
+        fontSize: 16,
+        fontColor: "black",
+        backgroundColor: "white",
+        backgroundOpacity: 0.85,
+        inFront: true
+      });
+
+      if (viewer.zoomTo) viewer.zoomTo();
+      if (viewer.render) viewer.render();
+
+      // Re-render solo cuando el contenedor cambie de tamaño de verdad
+      new ResizeObserver(() => {
+        if (viewer.resize) viewer.resize();
+        if (viewer.render) viewer.render();
+      }).observe(document.getElementById("viewer"));
+
+      console.log("✅ draw() OK: spheres should be visible");
+    } catch (e) {
+      console.error("❌ draw() error:", e);
+      try {
+        console.log("viewer keys:", Object.keys(viewer));
+        console.log("typeof addSphere:", typeof viewer.addSphere);
+        console.log("typeof addCylinder:", typeof viewer.addCylinder);
+      } catch (_) {}
+    }
+  }
+
+  // El autoloader invoca este callback con el modelo ya parseado:
+  // se puede dibujar directamente, sin sondear getModel() cada 25 ms
+  draw();
+}
+</script>
+
+</body>
+</html>
+""")
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _make_3dmol_embed_html(nc: int, R: float, r: float, etiqueta: str, ancho=560, alto=560) -> str:
+    """HTML del visor 3D, cacheado por estado físico: los reruns provocados por
+    los controles de zoom (u otras secciones) reutilizan la cadena ya generada."""
+    vertices_norm = _vertices_por_nc[nc]
+    xyz, vertices = _xyz_from_vertices(nc, vertices_norm, R, r)
+
+    enlaces = vertices[:6] if nc == 12 else vertices
+    enlaces_js = _dumps(enlaces.tolist())
+
+    etiqueta_html = _etiqueta_html(etiqueta)
+    # Altura de la etiqueta acotada por el radio de la cáscara (R + r): no hace
+    # falta recorrer los vértices para colocarla sobre la escena
+    label_z = (R + r) * 1.5 + 1.0
+
+    html = _EMBED_TMPL.substitute(
+        ancho=ancho, alto=alto, xyz=xyz, R=R, r=r,
+        enlaces_js=enlaces_js,
+        etiqueta_html=etiqueta_html, label_z=label_z,
+    )
+    return html
+
+
+# --- Cuadrícula 3×2 (modo comparar): un solo documento y un solo canvas WebGL ---
+_GRID_TMPL = string.Template("""
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8"/>
+  <script src="https://cdn.jsdelivr.net/npm/3dmol@2.4.2/build/3Dmol-min.js" crossorigin="anonymous"></script>
+  <script src="https://cdn.jsdelivr.net/npm/3dmol@2.4.2/build/3Dmol.ui-min.js" crossorigin="anonymous"></script>
+  <style>
+    body { margin: 0; padding: 0; background: transparent; }
+    #grid { width: ${grid_w}px; height: ${grid_h}px; position: relative; }
+    #info { width: ${grid_w}px; margin-top: 16px; }
+  </style>
+</head>
+<body>
+
+${pres}
+<div id="grid"></div>
+<div id="info">${info}</div>
+
+<script>
+const PANES = ${panes_js};
+
+function addAxesLike(viewer, L) {
+  viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:L,y:0,z:0}, radius:0.03, color:"red"});
+  viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:0,y:L,z:0}, radius:0.03, color:"green"});
+  viewer.addCylinder({start:{x:0,y:0,z:0}, end:{x:0,y:0,z:L}, radius:0.03, color:"blue"});
+}
+
+function drawPane(viewer, p) {
+  try {
+    // Esferas como estilo de átomos: una sola malla por panel
+    if (viewer.setStyle) {
+      viewer.setStyle({elem:"Cl"}, {sphere: {radius: p.R, color:"red", opacity:0.80}});
+      viewer.setStyle({elem:"Na"}, {sphere: {radius: p.r, color:"blue", opacity:1.00}});
+    }
+
+    addAxesLike(viewer, 1.2);
+
+    p.bonds.forEach(v => {
+      // Igual que en el visor individual: el cilindro arranca en la superficie del catión
+      const len = Math.hypot(v[0], v[1], v[2]);
+      const k = len > 0 ? p.r / len : 0;
+      viewer.addCylinder({start: {x: v[0]*k, y: v[1]*k, z: v[2]*k}, end: {x: v[0], y: v[1], z: v[2]}, radius: 0.05, color: "gray"});
+    });
+
+    viewer.addLabel(p.label, {
+      position: {x: 0, y: 0, z: p.labelZ},
+      fontSize: 16,
+      fontColor: "black",
+      backgroundColor: "white",
+      backgroundOpacity: 0.85,
+      inFront: true
+    });
+
+    if (viewer.zoomTo) viewer.zoomTo();
+    if (viewer.render) viewer.render();
+  } catch (e) {
+    console.error("drawPane error:", e);
+  }
+}
+
+window.addEventListener("DOMContentLoaded", () => {
+  // Un único canvas WebGL repartido en 3×2 subvisores (la celda sobrante queda en blanco)
+  const viewers = $$3Dmol.createViewerGrid(document.getElementById("grid"),
+      {rows: 3, cols: 2, control_all: false},
+      {backgroundColor: "#ffffff", antialias: false});
+
+  PANES.forEach((p, i) => {
+    const viewer = viewers[Math.floor(i / 2)][i % 2];
+    viewer.addModel(document.getElementById("moldata" + i).textContent, "xyz");
+    drawPane(viewer, p);
+  });
+
+  // Un solo observador re-renderiza las celdas cuando el contenedor cambia de tamaño
+  new ResizeObserver(() => {
+    viewers.flat().forEach(v => { if (v) { v.resize(); v.render(); } });
+  }).observe(document.getElementById("grid"));
+});
+</script>
+
+</body>
+</html>
+""")
+
+_INFO_CELL_HTML = """
+<div style="background-color: #f0f2f6; padding: 20px; border-radius: 10px; display: flex; flex-direction: column; justify-content: center;">
+    <h4 style="text-align: center;">📘 Información</h4>
+    <p style="text-align: center;">
+    <span style="color:blue;">● Catión (central)</span><br>
+    <span style="color:red;">● Aniones (coordinados)</span><br><br>
+    hader.martinez@upb.edu.co.
+    </p>
+</div>
+"""
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _make_3dmol_grid_html(specs, ancho: int = 450, alto: int = 450) -> str:
+    """Cuadrícula de visores en un único documento: 3Dmol.js se descarga una vez
+    y createViewerGrid reparte un solo contexto WebGL entre los paneles, en
+    lugar de un iframe (y un contexto) por geometría. La identidad de cada
+    panel viaja en su etiqueta 3D."""
+    pres = []
+    panes = []
+    for i, (nc, R, r, etiqueta) in enumerate(specs):
+        xyz, vertices = _xyz_from_vertices(nc, _vertices_por_nc[nc], R, r)
+        enlaces = vertices[:6] if nc == 12 else vertices
+        label_z = (R + r) * 1.5 + 1.0
+        panes.append({
+            "R": R, "r": r,
+            "bonds": enlaces.tolist(),
+            "label": _etiqueta_html(etiqueta), "labelZ": label_z,
+        })
+        pres.append(f'<pre id="moldata{i}" style="display:none;">{xyz}</pre>')
+    return _GRID_TMPL.substitute(grid_w=2 * ancho, grid_h=3 * alto,
+                                 pres="\n".join(pres), info=_INFO_CELL_HTML,
+                                 panes_js=_dumps(panes))
+
+@st.cache_data(show_spinner=False)
+def _compare_grid_html() -> str:
+    """HTML del modo comparar. Todas las entradas son constantes del módulo, así
+    que la clave de caché es vacía: tras la primera construcción cada rerun se
+    resuelve con una búsqueda O(1)."""
+    R_ANION_FIJO = 1.0
+    r_R_representativo = {3: 0.19, 4: 0.30, 6: 0.50, 8: 0.80, 12: 0.90}
+
+    specs = []
+    for nc in NC_TIPICOS:
+        _, geometria, intervalo = NC_INFO[nc]
+        etiqueta = f"NC = {nc}\\n{geometria}\\nr/R: {intervalo}"
+        r_rep = r_R_representativo[nc] * R_ANION_FIJO
+        specs.append((nc, R_ANION_FIJO, r_rep, etiqueta))
+
+    return _make_3dmol_grid_html(tuple(specs))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _html_data_url(html: str) -> str:
+    """data-URL base64 del documento embebido. Con el mismo src entre reruns el
+    diff de React deja el iframe montado en vez de recargar el documento."""
+    return "data:text/html;base64," + base64.b64encode(html.encode("utf-8")).decode("ascii")
+
+@st.fragment
+def _seccion_3d(radio_cation, radio_anion, relacion_r_R, nc_predicho):
+    """Visores 3D y cuadrícula de comparación.
+
+    Aislar esta sección en un fragmento evita que los controles de zoom de la
+    gráfica (u otras secciones) desmonten los iframes WebGL: solo los widgets
+    propios (modo, NC a explorar) la vuelven a ejecutar.
+    """
+    st.subheader("🧊 Geometrías de coordinación en 3D")
+    st.markdown(INTRO_3D_MD)
+
+    modo = st.radio(
+        "Modo de visualización",
+        options=[
+            "Mostrar solo la estructura predicha (según r/R)",
+            "Explorar (elegir NC manualmente)",
+            "Comparar todas (3×2)"
+        ],
+        index=0,
+        horizontal=True
+    )
+
+    if modo == "Explorar (elegir NC manualmente)":
+        nc_elegido = st.selectbox("Selecciona un NC para explorar", NC_TIPICOS, index=NC_INFO[nc_predicho][0])
+    else:
+        nc_elegido = nc_predicho
+
+    if modo == "Comparar todas (3×2)":
+        st.success("Modo comparar activado: se renderizan todas las geometrías (3×2).")
+        st.subheader("🧩 Cuadrícula 3×2 (comparación didáctica)")
+        # Un único iframe con las seis celdas: la librería 3D se carga una vez
+        st.components.v1.iframe(_html_data_url(_compare_grid_html()), height=1620)
+
+    else:
+        _, geometria, _ = NC_INFO[nc_elegido]
+        etiqueta = (
+            f"NC = {nc_elegido}\\n"
+            f"{geometria}\\n"
+            f"r = {radio_cation:.2f} Å\\n"
+            f"R = {radio_anion:.2f} Å\\n"
+            f"r/R = {relacion_r_R:.3f}"
+        )
+
+        visor_html = _make_3dmol_embed_html(nc_elegido, radio_anion, radio_cation, etiqueta, ancho=560, alto=560)
+
+        # Un solo st.markdown para el título: los <div> abiertos/cerrados en
+        # llamadas separadas nunca envuelven el iframe (cada elemento es un
+        # delta independiente) y solo añadían nodos extra al árbol
+        titulo = f"### ✅ Geometría mostrada: **NC = {nc_elegido}** · *{geometria}*"
+        if nc_elegido == nc_predicho:
+            titulo = (
+                '<div style="border: 3px solid gold; padding: 8px; border-radius: 12px;">'
+                f"✅ Geometría mostrada: <b>NC = {nc_elegido}</b> · <i>{geometria}</i></div>"
+            )
+        st.markdown(titulo, unsafe_allow_html=True)
+        st.components.v1.iframe(_html_data_url(visor_html), height=580)
+
+        st.caption(NOTAS_NC_CAPTION)
+        st.caption("Curso Ciencia de Los Materiales")
+
+_seccion_3d(radio_cation, radio_anion, relacion_r_R, nc_predicho)
+
+# ============================================================
+# 12. PIE DE PÁGINA
+# ============================================================
+st.caption("©️2025 H. Vladimir Martínez-Tejada. Basado en las reglas de radios de Pauling. Visualizaciones 3D con 3Dmol.js (embedding directo). Código y contenido: CC BY 4.0 (atribución requerida).")
+
+
+
+
+
+
+